@@ -3,11 +3,18 @@
 This module provides a Python client for interacting with the Malloy Publisher API.
 """
 
-from malloy_publisher_client.api_client import APIError, MalloyAPIClient, QueryParams
+from malloy_publisher_client.api_client import (
+    APIError,
+    AsyncMalloyAPIClient,
+    MalloyAPIClient,
+    QueryParams,
+    prepare_query_url,
+)
 from malloy_publisher_client.models import (
     About,
     Database,
     Error,
+    LazyJSON,
     Model,
     Package,
     Project,
@@ -18,8 +25,10 @@ from malloy_publisher_client.models import (
 __all__ = [
     "APIError",
     "About",
+    "AsyncMalloyAPIClient",
     "Database",
     "Error",
+    "LazyJSON",
     "MalloyAPIClient",
     "Model",
     "Package",
@@ -27,4 +36,5 @@ __all__ = [
     "QueryParams",
     "QueryResult",
     "Schedule",
+    "prepare_query_url",
 ]
@@ -4,11 +4,14 @@ This module provides a Python client for interacting with the Malloy Publisher A
 The client handles authentication, request formatting, and response parsing.
 """
 
+import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, cast
+from functools import lru_cache
+from typing import Any
 
 import httpx
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from malloy_publisher_client.models import (
     About,
@@ -21,7 +24,57 @@ from malloy_publisher_client.models import (
     Schedule,
 )
 
+# Reused TypeAdapters so list validation happens in a single pass over the
+# response bytes without rebuilding pydantic schemas per call.
+_PROJECT_LIST_ADAPTER = TypeAdapter(list[Project])
+_PACKAGE_LIST_ADAPTER = TypeAdapter(list[Package])
+_MODEL_LIST_ADAPTER = TypeAdapter(list[Model])
+_DATABASE_LIST_ADAPTER = TypeAdapter(list[Database])
+_SCHEDULE_LIST_ADAPTER = TypeAdapter(list[Schedule])
+_ERROR_ADAPTER = TypeAdapter(Error)
+
+_PROJECTS_PATH = "/api/v0/projects"
+
+
+@lru_cache(maxsize=256)
+def _project_path(project_name: str) -> str:
+    """Return the API path prefix for a project, cached across calls."""
+    return f"{_PROJECTS_PATH}/{project_name}"
+
+
+@lru_cache(maxsize=256)
+def _package_path(project_name: str, package_name: str) -> str:
+    """Return the API path prefix for a package, cached across calls.
+
+    Bulk fan-outs repeat the same project/package prefix for every request;
+    caching avoids re-formatting it each time.
+    """
+    return f"{_PROJECTS_PATH}/{project_name}/packages/{package_name}"
+
+
+@lru_cache(maxsize=256)
+def prepare_query_url(project_name: str, package_name: str, path: str) -> httpx.URL:
+    """Return the parsed queryResults URL for a model path.
+
+    Cached so repeated execute_query calls against the same
+    (project, package, path) reuse a single parsed ``httpx.URL`` instead of
+    re-parsing the URL string on every request.
+
+    Args:
+        project_name: Name of the project
+        package_name: Name of the package
+        path: Path to the model within the package
+
+    Returns:
+        Parsed URL for the queryResults endpoint
+    """
+    return httpx.URL(
+        _package_path(project_name, package_name) + "/queryResults/" + path
+    )
+
+
 # HTTP Status Codes
+HTTP_NOT_MODIFIED = 304
 HTTP_ERROR_STATUS = 400
 HTTP_BAD_REQUEST = 400
 HTTP_UNAUTHORIZED = 401
@@ -29,8 +82,18 @@ HTTP_NOT_FOUND = 404
 HTTP_SERVER_ERROR = 500
 HTTP_NOT_IMPLEMENTED = 501
 
+# Messages for HTTP errors surfaced by execute_query, looked up by status
+# code instead of an if/elif chain.
+_EXECUTE_QUERY_ERRORS = {
+    HTTP_BAD_REQUEST: "Bad request - invalid query parameters",
+    HTTP_UNAUTHORIZED: "Unauthorized - authentication required",
+    HTTP_NOT_FOUND: "Not found - project, package, or model not found",
+    HTTP_SERVER_ERROR: "Internal server error",
+    HTTP_NOT_IMPLEMENTED: "Not implemented",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class QueryParams:
     """Parameters for executing a query.
 
@@ -52,6 +115,18 @@ class QueryParams:
     query_name: str | None = None
     version_id: str | None = None
 
+    def __post_init__(self) -> None:
+        """Validate parameter combinations at construction time.
+
+        Raises:
+            ValueError: If both query and query_name are specified, or if
+                query_name is set without source_name.
+        """
+        if self.query and self.query_name:
+            raise ValueError("Cannot specify both query and query_name parameters")
+        if self.query_name and not self.source_name:
+            raise ValueError("source_name is required when query_name is specified")
+
 
 class APIError(Exception):
     """Exception raised for API-related errors.
@@ -61,57 +136,149 @@ class APIError(Exception):
         message: Error message from the API
     """
 
+    __slots__ = ("message", "status_code")
+
     def __init__(self, status_code: int, message: str) -> None:
         self.status_code = status_code
         self.message = message
         super().__init__(f"API Error {status_code}: {message}")
 
 
+def _handle_response(response: httpx.Response) -> bytes:
+    """Handle an API response and raise appropriate errors.
+
+    Shared by the sync and async clients; operates on an already-fetched
+    response so both can reuse the same error handling.
+
+    Returns the raw response body rather than a parsed dict so callers can
+    feed the bytes straight into pydantic's ``model_validate_json`` /
+    ``TypeAdapter.validate_json``, parsing and validating in a single pass.
+
+    Args:
+        response: HTTP response from the API
+
+    Returns:
+        Raw bytes of the response body
+
+    Raises:
+        APIError: If the response indicates an error
+    """
+    if response.status_code < HTTP_ERROR_STATUS:
+        return response.content
+    raw = response.content
+    try:
+        error = _ERROR_ADAPTER.validate_json(raw)
+        raise APIError(response.status_code, error.message)
+    except ValidationError as e:
+        message = raw.decode("utf-8", "replace")[:512]
+        raise APIError(response.status_code, message) from e
+
+
+_CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class _ResponseCache:
+    """Bounded LRU cache of ETag-validated response bodies.
+
+    Maps (url, sorted params) to the last ETag and body seen for that
+    request, so repeat reads can be revalidated with If-None-Match and
+    served locally when the server answers 304 Not Modified.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[_CacheKey, tuple[str, bytes]] = OrderedDict()
+
+    @staticmethod
+    def key(url: str, params: dict[str, str] | None) -> _CacheKey:
+        """Build a cache key from a URL and its query params."""
+        return (url, tuple(sorted(params.items())) if params else ())
+
+    def get(self, key: _CacheKey) -> tuple[str, bytes] | None:
+        """Return the cached (etag, body) for key, refreshing its recency."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: _CacheKey, etag: str, body: bytes) -> None:
+        """Store (etag, body) for key, evicting the least recent entry."""
+        self._entries[key] = (etag, body)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
 class MalloyAPIClient:
     """Client for interacting with the Malloy Publisher API.
 
     This client provides methods for interacting with the Malloy Publisher API,
     including listing projects, packages, models, and executing queries.
 
+    Create a single client instance and reuse it for all requests; the
+    underlying HTTP connection pool is only effective when shared.
+
     Attributes:
         base_url: Base URL of the API server
         api_key: Optional API key for authentication
         client: HTTP client for making requests
     """
 
-    def __init__(self, base_url: str, api_key: str | None = None) -> None:
+    def __init__(
+        self, base_url: str, api_key: str | None = None, cache: bool = False
+    ) -> None:
         """Initialize the API client.
 
         Args:
             base_url: Base URL of the API server
             api_key: Optional API key for authentication
+            cache: If True, cache GET responses and revalidate them with
+                ETags, serving 304 Not Modified answers from memory
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
+        self._cache = _ResponseCache() if cache else None
+        # Built once and shared with the client so every request reuses the
+        # same header dict instead of re-merging per call.
+        self._auth_header = {"Authorization": f"Bearer {api_key}"} if api_key else None
         self.client = httpx.Client(
             base_url=self.base_url,
-            headers={"Authorization": f"Bearer {api_key}"} if api_key else {},
+            headers=self._auth_header,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0,
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
         )
 
-    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
-        """Handle API response and raise appropriate errors.
+    def _get(self, url: str, params: dict[str, str] | None = None) -> bytes:
+        """Issue a GET request, serving revalidated responses from cache.
 
         Args:
-            response: HTTP response from the API
+            url: Request path relative to the base URL
+            params: Optional query parameters
 
         Returns:
-            Dict containing the parsed JSON response
+            Raw bytes of the response body
 
         Raises:
-            APIError: If the response indicates an error
+            APIError: If the API request fails
         """
-        if response.status_code >= HTTP_ERROR_STATUS:
-            try:
-                error = Error.model_validate(response.json())
-                raise APIError(response.status_code, error.message)
-            except ValidationError as e:
-                raise APIError(response.status_code, str(e)) from e
-        return cast(dict[str, Any], response.json())
+        if self._cache is None:
+            return _handle_response(self.client.get(url, params=params))
+        key = _ResponseCache.key(url, params)
+        cached = self._cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self.client.get(url, params=params, headers=headers)
+        if cached is not None and response.status_code == HTTP_NOT_MODIFIED:
+            return cached[1]
+        content = _handle_response(response)
+        etag = response.headers.get("etag")
+        if etag:
+            self._cache.set(key, etag, content)
+        return content
 
     def list_projects(self) -> list[Project]:
         """Returns a list of the Projects hosted on this server.
@@ -122,9 +289,8 @@ class MalloyAPIClient:
         Raises:
             APIError: If the API request fails
         """
-        response = self.client.get("/api/v0/projects")
-        data = self._handle_response(response)
-        return [Project.model_validate(project) for project in data]
+        content = self._get(_PROJECTS_PATH)
+        return _PROJECT_LIST_ADAPTER.validate_json(content)
 
     def get_about(self, project_name: str) -> About:
         """Returns metadata about the publisher service.
@@ -138,9 +304,8 @@ class MalloyAPIClient:
         Raises:
             APIError: If the API request fails
         """
-        response = self.client.get(f"/api/v0/projects/{project_name}/about")
-        data = self._handle_response(response)
-        return About.model_validate(data)
+        content = self._get(_project_path(project_name) + "/about")
+        return About.model_validate_json(content)
 
     def list_packages(self, project_name: str) -> list[Package]:
         """Returns a list of the Packages hosted on this server.
@@ -154,9 +319,8 @@ class MalloyAPIClient:
         Raises:
             APIError: If the API request fails
         """
-        response = self.client.get(f"/api/v0/projects/{project_name}/packages")
-        data = self._handle_response(response)
-        return [Package.model_validate(package) for package in data]
+        content = self._get(_project_path(project_name) + "/packages")
+        return _PACKAGE_LIST_ADAPTER.validate_json(content)
 
     def get_package(
         self,
@@ -177,12 +341,9 @@ class MalloyAPIClient:
         Raises:
             APIError: If the API request fails
         """
-        params = {"versionId": version_id} if version_id else {}
-        response = self.client.get(
-            f"/api/v0/projects/{project_name}/packages/{package_name}", params=params
-        )
-        data = self._handle_response(response)
-        return Package.model_validate(data)
+        params = {"versionId": version_id} if version_id else None
+        content = self._get(_package_path(project_name, package_name), params=params)
+        return Package.model_validate_json(content)
 
     def list_models(
         self,
@@ -203,16 +364,13 @@ class MalloyAPIClient:
         Raises:
             APIError: If the API request fails
         """
-        params = {"versionId": version_id} if version_id else {}
-        response = self.client.get(
-            f"/api/v0/projects/{project_name}/packages/{package_name}/models",
-            params=params,
+        params = {"versionId": version_id} if version_id else None
+        content = self._get(
+            _package_path(project_name, package_name) + "/models", params=params
+        )
+        return _MODEL_LIST_ADAPTER.validate_json(
+            content, context={"package_name": package_name}
         )
-        data = self._handle_response(response)
-        models_data = cast(list[dict[str, Any]], data)
-        for model_data in models_data:
-            model_data["packageName"] = package_name
-        return [Model.model_validate(model) for model in models_data]
 
     def get_model(self, project_name: str, package_name: str, model_name: str) -> Model:
         """Get a model by name.
@@ -228,20 +386,11 @@ class MalloyAPIClient:
         Raises:
             APIError: If the API request fails
         """
-        url_parts = [
-            "/api/v0/projects",
-            project_name,
-            "packages",
-            package_name,
-            "models",
-            model_name,
-        ]
-        url = "/".join(url_parts)
-        data = self._handle_response(self.client.get(url))
-        model_data = data
-        model_data["path"] = model_data.pop("modelPath")
-        model_data["packageName"] = package_name
-        return Model.model_validate(model_data)
+        url = _package_path(project_name, package_name) + "/models/" + model_name
+        content = self._get(url)
+        return Model.model_validate_json(
+            content, context={"package_name": package_name}
+        )
 
     def execute_query(self, params: QueryParams) -> QueryResult:
         """Returns a query and its results.
@@ -263,45 +412,30 @@ class MalloyAPIClient:
                 - query_result: Malloy query results
 
         Raises:
-            ValueError: If both query and query_name are specified, or if query_name
-                is set without source_name.
             APIError: If the API request fails with a client or server error.
         """
-        if params.query and params.query_name:
-            raise ValueError("Cannot specify both query and query_name parameters")
-        if params.query_name and not params.source_name:
-            raise ValueError("source_name is required when query_name is specified")
-
-        request_params = {
-            "versionId": params.version_id,
-            "query": params.query,
-            "sourceName": params.source_name,
-            "queryName": params.query_name,
-        }
-        request_params = {k: v for k, v in request_params.items() if v is not None}
+        request_params: dict[str, str] = {}
+        if params.version_id:
+            request_params["versionId"] = params.version_id
+        if params.query:
+            request_params["query"] = params.query
+        if params.source_name:
+            request_params["sourceName"] = params.source_name
+        if params.query_name:
+            request_params["queryName"] = params.query_name
 
         try:
-            url = (
-                f"/api/v0/projects/{params.project_name}/packages/"
-                f"{params.package_name}/queryResults/{params.path}"
+            url = prepare_query_url(
+                params.project_name, params.package_name, params.path
             )
-            response = self.client.get(url, params=request_params)
-            data = self._handle_response(response)
-            return QueryResult.model_validate(data)
+            with self.client.stream("GET", url, params=request_params) as response:
+                response.read()
+                content = _handle_response(response)
+            return QueryResult.model_validate_json(content)
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == HTTP_BAD_REQUEST:
-                msg = "Bad request - invalid query parameters"
-                raise APIError(HTTP_BAD_REQUEST, msg) from e
-            elif e.response.status_code == HTTP_UNAUTHORIZED:
-                msg = "Unauthorized - authentication required"
-                raise APIError(HTTP_UNAUTHORIZED, msg) from e
-            elif e.response.status_code == HTTP_NOT_FOUND:
-                msg = "Not found - project, package, or model not found"
-                raise APIError(HTTP_NOT_FOUND, msg) from e
-            elif e.response.status_code == HTTP_SERVER_ERROR:
-                raise APIError(HTTP_SERVER_ERROR, "Internal server error") from e
-            elif e.response.status_code == HTTP_NOT_IMPLEMENTED:
-                raise APIError(HTTP_NOT_IMPLEMENTED, "Not implemented") from e
+            msg = _EXECUTE_QUERY_ERRORS.get(e.response.status_code)
+            if msg is not None:
+                raise APIError(e.response.status_code, msg) from e
             raise
 
     def list_databases(
@@ -323,13 +457,11 @@ class MalloyAPIClient:
         Raises:
             APIError: If the API request fails
         """
-        params = {"versionId": version_id} if version_id else {}
-        response = self.client.get(
-            f"/api/v0/projects/{project_name}/packages/{package_name}/databases",
-            params=params,
+        params = {"versionId": version_id} if version_id else None
+        content = self._get(
+            _package_path(project_name, package_name) + "/databases", params=params
         )
-        data = self._handle_response(response)
-        return [Database.model_validate(db) for db in data]
+        return _DATABASE_LIST_ADAPTER.validate_json(content)
 
     def list_schedules(
         self,
@@ -350,13 +482,11 @@ class MalloyAPIClient:
         Raises:
             APIError: If the API request fails
         """
-        params = {"versionId": version_id} if version_id else {}
-        response = self.client.get(
-            f"/api/v0/projects/{project_name}/packages/{package_name}/schedules",
-            params=params,
+        params = {"versionId": version_id} if version_id else None
+        content = self._get(
+            _package_path(project_name, package_name) + "/schedules", params=params
         )
-        data = self._handle_response(response)
-        return [Schedule.model_validate(schedule) for schedule in data]
+        return _SCHEDULE_LIST_ADAPTER.validate_json(content)
 
     def close(self) -> None:
         """Close the HTTP client."""
@@ -374,3 +504,394 @@ class MalloyAPIClient:
     ) -> None:
         """Context manager exit."""
         self.close()
+
+
+class AsyncMalloyAPIClient:
+    """Async client for interacting with the Malloy Publisher API.
+
+    This client mirrors :class:`MalloyAPIClient` using ``httpx.AsyncClient``,
+    allowing callers to issue concurrent requests (e.g. with
+    ``asyncio.gather``) so fan-out traversals overlap network latency
+    instead of serializing it.
+
+    Create a single client instance and reuse it for all requests; the
+    underlying HTTP connection pool is only effective when shared.
+
+    Attributes:
+        base_url: Base URL of the API server
+        api_key: Optional API key for authentication
+        client: Async HTTP client for making requests
+    """
+
+    def __init__(
+        self, base_url: str, api_key: str | None = None, cache: bool = False
+    ) -> None:
+        """Initialize the async API client.
+
+        Args:
+            base_url: Base URL of the API server
+            api_key: Optional API key for authentication
+            cache: If True, cache GET responses and revalidate them with
+                ETags, serving 304 Not Modified answers from memory
+        """
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self._cache = _ResponseCache() if cache else None
+        # Built once and shared with the client so every request reuses the
+        # same header dict instead of re-merging per call.
+        self._auth_header = {"Authorization": f"Bearer {api_key}"} if api_key else None
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._auth_header,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0,
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+
+    async def _get(self, url: str, params: dict[str, str] | None = None) -> bytes:
+        """Issue a GET request, serving revalidated responses from cache.
+
+        Args:
+            url: Request path relative to the base URL
+            params: Optional query parameters
+
+        Returns:
+            Raw bytes of the response body
+
+        Raises:
+            APIError: If the API request fails
+        """
+        if self._cache is None:
+            return _handle_response(await self.client.get(url, params=params))
+        key = _ResponseCache.key(url, params)
+        cached = self._cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = await self.client.get(url, params=params, headers=headers)
+        if cached is not None and response.status_code == HTTP_NOT_MODIFIED:
+            return cached[1]
+        content = _handle_response(response)
+        etag = response.headers.get("etag")
+        if etag:
+            self._cache.set(key, etag, content)
+        return content
+
+    async def list_projects(self) -> list[Project]:
+        """Returns a list of the Projects hosted on this server.
+
+        Returns:
+            List of Project objects containing project names
+
+        Raises:
+            APIError: If the API request fails
+        """
+        content = await self._get(_PROJECTS_PATH)
+        return _PROJECT_LIST_ADAPTER.validate_json(content)
+
+    async def get_about(self, project_name: str) -> About:
+        """Returns metadata about the publisher service.
+
+        Args:
+            project_name: Name of the project
+
+        Returns:
+            About object containing service metadata
+
+        Raises:
+            APIError: If the API request fails
+        """
+        content = await self._get(_project_path(project_name) + "/about")
+        return About.model_validate_json(content)
+
+    async def list_packages(self, project_name: str) -> list[Package]:
+        """Returns a list of the Packages hosted on this server.
+
+        Args:
+            project_name: Name of the project
+
+        Returns:
+            List of Package objects containing package information
+
+        Raises:
+            APIError: If the API request fails
+        """
+        content = await self._get(_project_path(project_name) + "/packages")
+        return _PACKAGE_LIST_ADAPTER.validate_json(content)
+
+    async def get_package(
+        self,
+        project_name: str,
+        package_name: str,
+        version_id: str | None = None,
+    ) -> Package:
+        """Returns the package metadata.
+
+        Args:
+            project_name: Name of the project
+            package_name: Name of the package
+            version_id: Optional version ID of the package
+
+        Returns:
+            Package object containing package metadata
+
+        Raises:
+            APIError: If the API request fails
+        """
+        params = {"versionId": version_id} if version_id else None
+        content = await self._get(
+            _package_path(project_name, package_name), params=params
+        )
+        return Package.model_validate_json(content)
+
+    async def list_models(
+        self,
+        project_name: str,
+        package_name: str,
+        version_id: str | None = None,
+    ) -> list[Model]:
+        """Returns a list of relative paths to the models in the package.
+
+        Args:
+            project_name: Name of the project
+            package_name: Name of the package
+            version_id: Optional version ID of the package
+
+        Returns:
+            List of Model objects containing model information
+
+        Raises:
+            APIError: If the API request fails
+        """
+        params = {"versionId": version_id} if version_id else None
+        content = await self._get(
+            _package_path(project_name, package_name) + "/models", params=params
+        )
+        return _MODEL_LIST_ADAPTER.validate_json(
+            content, context={"package_name": package_name}
+        )
+
+    async def get_model(
+        self, project_name: str, package_name: str, model_name: str
+    ) -> Model:
+        """Get a model by name.
+
+        Args:
+            project_name: Name of the project
+            package_name: Name of the package
+            model_name: Name of the model
+
+        Returns:
+            Model object containing model information
+
+        Raises:
+            APIError: If the API request fails
+        """
+        url = _package_path(project_name, package_name) + "/models/" + model_name
+        content = await self._get(url)
+        return Model.model_validate_json(
+            content, context={"package_name": package_name}
+        )
+
+    async def execute_query(self, params: QueryParams) -> QueryResult:
+        """Returns a query and its results.
+
+        Args:
+            params: Query parameters containing:
+                - project_name: Name of the project
+                - package_name: Name of the package
+                - path: Path to model within the package
+                - query: Optional query string to execute on the model
+                - source_name: Optional name of the source in the model
+                - query_name: Optional name of a query to execute on a source
+                - version_id: Optional version ID
+
+        Returns:
+            QueryResult: The query results containing:
+                - data_styles: Data style for rendering query results
+                - model_def: Malloy model definition
+                - query_result: Malloy query results
+
+        Raises:
+            APIError: If the API request fails with a client or server error.
+        """
+        request_params: dict[str, str] = {}
+        if params.version_id:
+            request_params["versionId"] = params.version_id
+        if params.query:
+            request_params["query"] = params.query
+        if params.source_name:
+            request_params["sourceName"] = params.source_name
+        if params.query_name:
+            request_params["queryName"] = params.query_name
+
+        try:
+            url = prepare_query_url(
+                params.project_name, params.package_name, params.path
+            )
+            async with self.client.stream(
+                "GET", url, params=request_params
+            ) as response:
+                await response.aread()
+                content = _handle_response(response)
+            return QueryResult.model_validate_json(content)
+        except httpx.HTTPStatusError as e:
+            msg = _EXECUTE_QUERY_ERRORS.get(e.response.status_code)
+            if msg is not None:
+                raise APIError(e.response.status_code, msg) from e
+            raise
+
+    async def list_databases(
+        self,
+        project_name: str,
+        package_name: str,
+        version_id: str | None = None,
+    ) -> list[Database]:
+        """Returns a list of relative paths to the databases embedded in the package.
+
+        Args:
+            project_name: Name of the project
+            package_name: Name of the package
+            version_id: Optional version ID of the package
+
+        Returns:
+            List of Database objects containing database information
+
+        Raises:
+            APIError: If the API request fails
+        """
+        params = {"versionId": version_id} if version_id else None
+        content = await self._get(
+            _package_path(project_name, package_name) + "/databases", params=params
+        )
+        return _DATABASE_LIST_ADAPTER.validate_json(content)
+
+    async def list_schedules(
+        self,
+        project_name: str,
+        package_name: str,
+        version_id: str | None = None,
+    ) -> list[Schedule]:
+        """Returns a list of running schedules.
+
+        Args:
+            project_name: Name of the project
+            package_name: Name of the package
+            version_id: Optional version ID of the package
+
+        Returns:
+            List of Schedule objects containing schedule information
+
+        Raises:
+            APIError: If the API request fails
+        """
+        params = {"versionId": version_id} if version_id else None
+        content = await self._get(
+            _package_path(project_name, package_name) + "/schedules", params=params
+        )
+        return _SCHEDULE_LIST_ADAPTER.validate_json(content)
+
+    async def get_packages_bulk(
+        self,
+        project_name: str,
+        package_names: list[str],
+        concurrency: int = 10,
+    ) -> list[Package]:
+        """Fetch many packages concurrently.
+
+        Requests are issued with ``asyncio.gather`` under a bounded
+        semaphore, so N fetches take roughly ceil(N / concurrency) round
+        trips instead of N sequential ones.
+
+        Args:
+            project_name: Name of the project
+            package_names: Names of the packages to fetch
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            List of Package objects in the same order as package_names
+
+        Raises:
+            APIError: If any API request fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(package_name: str) -> Package:
+            async with semaphore:
+                return await self.get_package(project_name, package_name)
+
+        return await asyncio.gather(*(fetch(name) for name in package_names))
+
+    async def list_models_bulk(
+        self,
+        project_name: str,
+        package_names: list[str],
+        concurrency: int = 10,
+    ) -> list[list[Model]]:
+        """List the models of many packages concurrently.
+
+        Args:
+            project_name: Name of the project
+            package_names: Names of the packages to list models for
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            One list of Model objects per package, in the same order as
+            package_names
+
+        Raises:
+            APIError: If any API request fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(package_name: str) -> list[Model]:
+            async with semaphore:
+                return await self.list_models(project_name, package_name)
+
+        return await asyncio.gather(*(fetch(name) for name in package_names))
+
+    async def get_models_bulk(
+        self,
+        project_name: str,
+        specs: list[tuple[str, str]],
+        concurrency: int = 10,
+    ) -> list[Model]:
+        """Fetch many models concurrently.
+
+        Args:
+            project_name: Name of the project
+            specs: (package_name, model_name) pairs to fetch
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            List of Model objects in the same order as specs
+
+        Raises:
+            APIError: If any API request fails
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(package_name: str, model_name: str) -> Model:
+            async with semaphore:
+                return await self.get_model(project_name, package_name, model_name)
+
+        return await asyncio.gather(*(fetch(pkg, name) for pkg, name in specs))
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncMalloyAPIClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any | None,
+    ) -> None:
+        """Async context manager exit."""
+        await self.close()
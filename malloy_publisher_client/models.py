@@ -4,10 +4,112 @@ This module contains Pydantic models for the Malloy Publisher API.
 These models handle data validation and serialization for API requests and responses.
 """
 
+import json
 from enum import Enum
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+import orjson
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
+    ValidationInfo,
+    model_validator,
+)
+from pydantic_core import core_schema
+
+# Sentinel marking a LazyJSON payload whose contents have not been parsed yet.
+_UNPARSED = object()
+
+
+class LazyJSON:
+    """Lazily parsed JSON payload.
+
+    Wraps a raw JSON string (or an already-parsed object) and defers parsing
+    until the contents are first accessed. Query results embed large JSON
+    blobs that many callers never read; deferring the parse avoids paying
+    for it up front. The parsed value is cached after the first access.
+
+    Attributes:
+        raw: The raw JSON text of the payload
+    """
+
+    __slots__ = ("_parsed", "_raw")
+
+    def __init__(self, raw: str | bytes | dict[str, Any] | list[Any]) -> None:
+        if isinstance(raw, str | bytes):
+            self._raw: str | bytes | None = raw
+            self._parsed: Any = _UNPARSED
+        else:
+            self._raw = None
+            self._parsed = raw
+
+    @property
+    def raw(self) -> str | bytes:
+        """The raw JSON text, serializing the parsed value if necessary."""
+        if self._raw is None:
+            self._raw = json.dumps(self._parsed)
+        return self._raw
+
+    def _parse(self) -> Any:
+        if self._parsed is _UNPARSED:
+            self._parsed = orjson.loads(self._raw)  # type: ignore[arg-type]
+        return self._parsed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Parse the payload as a JSON object.
+
+        Raises:
+            TypeError: If the payload is not a JSON object
+        """
+        parsed = self._parse()
+        if not isinstance(parsed, dict):
+            raise TypeError(f"JSON payload is {type(parsed).__name__}, not dict")
+        return parsed
+
+    def as_list(self) -> list[Any]:
+        """Parse the payload as a JSON array.
+
+        Raises:
+            TypeError: If the payload is not a JSON array
+        """
+        parsed = self._parse()
+        if not isinstance(parsed, list):
+            raise TypeError(f"JSON payload is {type(parsed).__name__}, not list")
+        return parsed
+
+    def __repr__(self) -> str:
+        if self._parsed is _UNPARSED:
+            return f"LazyJSON(unparsed, {len(self._raw)} chars)"  # type: ignore[arg-type]
+        return f"LazyJSON({self._parsed!r})"
+
+    @classmethod
+    def _validate(cls, value: Any) -> "LazyJSON":
+        if isinstance(value, LazyJSON):
+            return value
+        return cls(value)
+
+    def _serialize(self) -> str:
+        raw = self.raw
+        return raw.decode() if isinstance(raw, bytes) else raw
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Validate raw payloads into the wrapper and dump the raw JSON text.
+
+        Lets models use LazyJSON as a field type directly: validation wraps
+        without parsing, and model_dump/model_dump_json emit the raw text so
+        serialization round-trips like the plain fields it replaced.
+        """
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize, return_schema=core_schema.str_schema()
+            ),
+        )
 
 
 class ModelType(str, Enum):
@@ -147,12 +249,7 @@ class NotebookCell(BaseModel):
     query_name: str | None = Field(None, alias="queryName")
     query_result: dict[str, Any] | None = Field(None, alias="queryResult")
 
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=lambda x: "".join(
-            word.capitalize() if i > 0 else word for i, word in enumerate(x.split("_"))
-        ),
-    )
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class Model(BaseModel):
@@ -165,9 +262,32 @@ class Model(BaseModel):
     """
 
     package_name: str = Field(alias="packageName")
-    path: str
+    path: str = Field(alias="modelPath")
     type: ModelType
 
+    model_config = ConfigDict(populate_by_name=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _default_package_name(cls, data: Any, info: ValidationInfo) -> Any:
+        """Fill packageName from the validation context when absent.
+
+        The model endpoints omit the package name from their payloads; the
+        client supplies it via ``context={"package_name": ...}`` so payloads
+        validate straight from bytes without a dict-mutation pre-pass.
+        """
+        context = info.context
+        if (
+            context is not None
+            and isinstance(data, dict)
+            and "packageName" not in data
+            and "package_name" not in data
+        ):
+            package_name = context.get("package_name")
+            if package_name is not None:
+                data = {**data, "packageName": package_name}
+        return data
+
 
 class CompiledModel(Model):
     """Compiled model definition.
@@ -186,38 +306,38 @@ class CompiledModel(Model):
     model_def: dict[str, Any] = Field(alias="modelDef")
     sources: list[Source]
     queries: list[Query]
-    notebook_cells: list[NotebookCell] = Field(alias="notebookCells", default_factory=list)
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=lambda x: "".join(
-            word.capitalize() if i > 0 else word for i, word in enumerate(x.split("_"))
-        ),
+    notebook_cells: list[NotebookCell] = Field(
+        alias="notebookCells", default_factory=list
     )
 
+    # Deferred: this schema (with its nested Source/View/Query/NotebookCell
+    # trees) is heavy to build and not needed by the client's hot paths, so
+    # build it on first validation rather than at import time.
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
 
 class QueryResult(BaseModel):
     """Query execution result.
 
+    The three payload fields are opaque JSON blobs whose contents are only
+    parsed on first access via :class:`LazyJSON`.
+
     Attributes:
         data_styles: Data style definitions for rendering results
         model_def: Compiled model definition
         query_result: Query execution results
     """
 
-    data_styles: dict[str, Any] = Field(
+    data_styles: LazyJSON = Field(
         alias="dataStyles", description="Data style for rendering query results"
     )
-    model_def: dict[str, Any] = Field(alias="modelDef", description="Malloy model definition")
-    query_result: dict[str, Any] = Field(alias="queryResult", description="Malloy query results")
-
-    model_config = ConfigDict(
-        populate_by_name=True,
-        alias_generator=lambda x: "".join(
-            word.capitalize() if i > 0 else word for i, word in enumerate(x.split("_"))
-        ),
+    model_def: LazyJSON = Field(alias="modelDef", description="Malloy model definition")
+    query_result: LazyJSON = Field(
+        alias="queryResult", description="Malloy query results"
     )
 
+    model_config = ConfigDict(populate_by_name=True)
+
 
 class Database(BaseModel):
     """Database information.
@@ -357,3 +477,7 @@ class Connection(BaseModel):
         None, alias="snowflakeConnection"
     )
     trino_connection: TrinoConnection | None = Field(None, alias="trinoConnection")
+
+    # Deferred for the same reason as CompiledModel: the nested connection
+    # schemas are never validated by the client's hot paths.
+    model_config = ConfigDict(defer_build=True)
@@ -0,0 +1,150 @@
+"""Tests for the async Malloy API client.
+
+This module mirrors the sync client tests for AsyncMalloyAPIClient so the
+two hand-duplicated clients cannot drift apart unnoticed. It exercises the
+core read path, query execution, and the bulk fan-out helpers.
+"""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from malloy_publisher_client import AsyncMalloyAPIClient, QueryParams
+from malloy_publisher_client.models import LazyJSON, ModelType
+
+
+@pytest_asyncio.fixture
+async def client() -> AsyncGenerator[AsyncMalloyAPIClient, None]:
+    """Create an async Malloy Publisher API client instance.
+
+    Yields:
+        AsyncMalloyAPIClient: A configured async API client instance
+    """
+    async with AsyncMalloyAPIClient("http://localhost:4000") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_list_projects(client: AsyncMalloyAPIClient) -> None:
+    """Test listing projects.
+
+    Verifies that:
+    1. The response is a list
+    2. At least one project exists
+    3. Each project has a name attribute
+    4. The home project exists
+    """
+    projects = await client.list_projects()
+    assert isinstance(projects, list)
+    # At least one project should exist
+    assert len(projects) > 0
+    # Each project should have a name
+    for project in projects:
+        assert hasattr(project, "name")
+        assert isinstance(project.name, str)
+    # The home project should exist
+    assert any(project.name == "home" for project in projects)
+
+
+@pytest.mark.asyncio
+async def test_get_model(client: AsyncMalloyAPIClient) -> None:
+    """Test getting model details.
+
+    Verifies that:
+    1. A model can be retrieved by name
+    2. The model has required attributes
+    3. The attributes have correct types
+    """
+    packages = await client.list_packages("home")
+    assert len(packages) > 0
+    package_name = packages[0].name
+
+    models = await client.list_models("home", package_name)
+    assert len(models) > 0
+    model_path = models[0].path
+
+    model = await client.get_model("home", package_name, model_path)
+    assert hasattr(model, "package_name")
+    assert hasattr(model, "path")
+    assert hasattr(model, "type")
+    assert isinstance(model.package_name, str)
+    assert isinstance(model.path, str)
+    assert isinstance(model.type, ModelType)
+
+
+@pytest.mark.asyncio
+async def test_execute_query(client: AsyncMalloyAPIClient) -> None:
+    """Test executing a query.
+
+    Verifies that:
+    1. A named query can be executed
+    2. The response has required attributes
+    3. The attributes have correct types
+    4. Error cases are handled correctly
+    """
+    # Test with a named query
+    query_params = QueryParams(
+        project_name="home",
+        package_name="faa",
+        path="flights.malloy",
+        source_name="flights",
+        query_name="top_carriers",
+    )
+
+    result = await client.execute_query(query_params)
+    assert hasattr(result, "data_styles")
+    assert hasattr(result, "model_def")
+    assert hasattr(result, "query_result")
+    assert isinstance(result.data_styles, LazyJSON)
+    assert isinstance(result.model_def, LazyJSON)
+    assert isinstance(result.query_result, LazyJSON)
+    assert isinstance(result.query_result.as_dict(), dict)
+
+    # Test error cases
+    error_msg = "Cannot specify both query and query_name parameters"
+    with pytest.raises(ValueError, match=error_msg):
+        await client.execute_query(
+            QueryParams(
+                project_name="home",
+                package_name="faa",
+                path="flights.malloy",
+                query="test query",
+                query_name="test_query",
+            )
+        )
+
+    error_msg = "source_name is required when query_name is specified"
+    with pytest.raises(ValueError, match=error_msg):
+        await client.execute_query(
+            QueryParams(
+                project_name="home",
+                package_name="faa",
+                path="flights.malloy",
+                query_name="test_query",
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_models_bulk(client: AsyncMalloyAPIClient) -> None:
+    """Test fetching models in bulk.
+
+    Verifies that:
+    1. Concurrent fetches return one model per spec
+    2. Results preserve the order of the input specs
+    3. Each model matches its requested package and path
+    """
+    packages = await client.list_packages("home")
+    assert len(packages) > 0
+    package_name = packages[0].name
+
+    models = await client.list_models("home", package_name)
+    assert len(models) > 0
+    specs = [(package_name, model.path) for model in models]
+
+    fetched = await client.get_models_bulk("home", specs, concurrency=5)
+    assert len(fetched) == len(specs)
+    for (spec_package, spec_path), model in zip(specs, fetched, strict=True):
+        assert model.package_name == spec_package
+        assert model.path == spec_path
@@ -10,7 +10,7 @@ from collections.abc import Generator
 import pytest
 
 from malloy_publisher_client import MalloyAPIClient, QueryParams
-from malloy_publisher_client.models import ModelType
+from malloy_publisher_client.models import LazyJSON, ModelType
 
 
 @pytest.fixture
@@ -164,9 +164,10 @@ def test_execute_query(client: MalloyAPIClient) -> None:
     assert hasattr(result, "data_styles")
     assert hasattr(result, "model_def")
     assert hasattr(result, "query_result")
-    assert isinstance(result.data_styles, str)
-    assert isinstance(result.model_def, str)
-    assert isinstance(result.query_result, str)
+    assert isinstance(result.data_styles, LazyJSON)
+    assert isinstance(result.model_def, LazyJSON)
+    assert isinstance(result.query_result, LazyJSON)
+    assert isinstance(result.query_result.as_dict(), dict)
 
     # Test error cases
     error_msg = "Cannot specify both query and query_name parameters"
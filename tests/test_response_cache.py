@@ -0,0 +1,129 @@
+"""Tests for the ETag-aware response cache.
+
+Unlike the integration test modules, these tests run against an in-process
+httpx.MockTransport and need no live publisher. They cover cache misses,
+ETag revalidation with 304 responses served from memory, and LRU eviction.
+"""
+
+from collections.abc import Callable
+
+import httpx
+
+from malloy_publisher_client import MalloyAPIClient
+from malloy_publisher_client.api_client import _ResponseCache
+
+
+def _make_client(
+    handler: Callable[[httpx.Request], httpx.Response], cache: bool = True
+) -> MalloyAPIClient:
+    """Create a client whose transport is served by an in-process handler."""
+    client = MalloyAPIClient("http://testserver", cache=cache)
+    client.client = httpx.Client(
+        base_url="http://testserver", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_miss_fetches_without_validator() -> None:
+    """A cold cache issues a plain GET with no If-None-Match header."""
+    validators = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        validators.append(request.headers.get("if-none-match"))
+        return httpx.Response(200, json=[{"name": "home"}], headers={"ETag": '"v1"'})
+
+    client = _make_client(handler)
+    projects = client.list_projects()
+    assert [project.name for project in projects] == ["home"]
+    assert validators == [None]
+
+
+def test_304_served_from_cache() -> None:
+    """A repeat read revalidates with If-None-Match and reuses the cached body."""
+    validators = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        validator = request.headers.get("if-none-match")
+        validators.append(validator)
+        if validator == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=[{"name": "home"}], headers={"ETag": '"v1"'})
+
+    client = _make_client(handler)
+    first = client.list_projects()
+    second = client.list_projects()
+    # The second request carried the stored ETag and was answered with a
+    # bodiless 304, yet still produced the full cached result.
+    assert validators == [None, '"v1"']
+    assert [project.name for project in second] == [project.name for project in first]
+
+
+def test_changed_etag_replaces_cached_entry() -> None:
+    """A 200 with a new ETag refreshes both the stored body and validator."""
+    validators = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        validators.append(request.headers.get("if-none-match"))
+        if len(validators) == 1:
+            return httpx.Response(200, json=[{"name": "old"}], headers={"ETag": '"v1"'})
+        return httpx.Response(200, json=[{"name": "new"}], headers={"ETag": '"v2"'})
+
+    client = _make_client(handler)
+    assert client.list_projects()[0].name == "old"
+    assert client.list_projects()[0].name == "new"
+    client.list_projects()
+    # Third request revalidates against the replacement ETag.
+    assert validators == [None, '"v1"', '"v2"']
+
+
+def test_uncached_responses_without_etag() -> None:
+    """Responses lacking an ETag are never cached or revalidated."""
+    validators = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        validators.append(request.headers.get("if-none-match"))
+        return httpx.Response(200, json=[{"name": "home"}])
+
+    client = _make_client(handler)
+    client.list_projects()
+    client.list_projects()
+    assert validators == [None, None]
+
+
+def test_cache_disabled_by_default() -> None:
+    """Without cache=True the client sends plain GETs every time."""
+    validators = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        validators.append(request.headers.get("if-none-match"))
+        return httpx.Response(200, json=[{"name": "home"}], headers={"ETag": '"v1"'})
+
+    client = _make_client(handler, cache=False)
+    client.list_projects()
+    client.list_projects()
+    assert validators == [None, None]
+
+
+def test_key_normalizes_param_order() -> None:
+    """Cache keys are insensitive to query-param ordering."""
+    assert _ResponseCache.key("/url", {"a": "1", "b": "2"}) == _ResponseCache.key(
+        "/url", {"b": "2", "a": "1"}
+    )
+    assert _ResponseCache.key("/url", None) == _ResponseCache.key("/url", {})
+
+
+def test_lru_eviction_at_maxsize() -> None:
+    """Inserting past maxsize evicts the least recently used entry."""
+    cache = _ResponseCache(maxsize=2)
+    key_a = _ResponseCache.key("/a", None)
+    key_b = _ResponseCache.key("/b", None)
+    key_c = _ResponseCache.key("/c", None)
+
+    cache.set(key_a, '"a"', b"a")
+    cache.set(key_b, '"b"', b"b")
+    # Reading /a refreshes its recency, so /b is the eviction candidate.
+    assert cache.get(key_a) == ('"a"', b"a")
+    cache.set(key_c, '"c"', b"c")
+    assert cache.get(key_b) is None
+    assert cache.get(key_a) == ('"a"', b"a")
+    assert cache.get(key_c) == ('"c"', b"c")